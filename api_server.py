@@ -0,0 +1,335 @@
+"""
+Read-only local HTTP JSON API over the dashboard's data and KPIs.
+
+Serves the same cleaned data, composite indices and country snapshots as
+the Streamlit pages (via backend.py). The dataset is loaded once at
+startup and shared by all request threads; responses carry an ETag for
+conditional requests and are gzip-compressed when the client accepts it.
+
+Usage:
+    python api_server.py                      # http://127.0.0.1:8502
+    python api_server.py --port 9000
+
+Endpoints (all GET):
+    /health
+    /countries
+    /years
+    /columns
+    /rows?country=Germany,France&year_from=2005&year_to=2010&columns=GDP,Schooling
+    /snapshot?country=Germany&year=2015
+    /kpi?metric=Health_Index&country=Germany,France&year_from=2000&year_to=2015
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit
+
+import numpy as np
+
+from backend import DATA_PATH, COMPOSITE_INDICES, load_dataset, snapshot
+
+
+GZIP_MIN_BYTES = 1024
+CACHE_SECONDS = 300
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ===============================================================
+#                     SHARED READ-ONLY STATE
+# ===============================================================
+
+_STATE = {}
+
+
+def load_state(path=DATA_PATH):
+    """Load the dataset once; the version hash seeds every ETag."""
+    with open(path, "rb") as fh:
+        version = hashlib.sha1(fh.read()).hexdigest()[:16]
+    df, cols = load_dataset(path)
+    _STATE.update(df=df, cols=cols, version=version)
+    render.cache_clear()
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"not JSON serialisable: {type(obj).__name__}")
+
+
+# ===============================================================
+#                          QUERY HELPERS
+# ===============================================================
+
+def _list_param(params, name):
+    values = []
+    for raw in params.get(name, []):
+        values.extend(v.strip() for v in raw.split(",") if v.strip())
+    return values
+
+
+def _int_param(params, name, default=None):
+    raw = params.get(name, [None])[-1]
+    if raw is None or raw == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ApiError(400, f"'{name}' must be an integer")
+
+
+def _select(df, params):
+    """Apply the shared country / year-range filters."""
+    countries = _list_param(params, "country")
+    unknown = sorted(set(countries) - set(df["Country"]))
+    if unknown:
+        raise ApiError(404, f"unknown country: {', '.join(unknown)}")
+
+    year = _int_param(params, "year")
+    year_from = _int_param(params, "year_from", year)
+    year_to = _int_param(params, "year_to", year)
+
+    mask = np.ones(len(df), dtype=bool)
+    if countries:
+        mask &= df["Country"].isin(countries).to_numpy()
+    if year_from is not None:
+        mask &= (df["Year"] >= year_from).to_numpy()
+    if year_to is not None:
+        mask &= (df["Year"] <= year_to).to_numpy()
+    return df[mask]
+
+
+def _public_columns(df):
+    """Columns exposed by the API; `_`-prefixed ones (e.g. `_imputed`) are internal."""
+    return [c for c in df.columns if not c.startswith("_")]
+
+
+def _resolve_metric(df, cols, name):
+    if name in cols and cols[name]:
+        return cols[name]
+    if name in _public_columns(df) and name not in ("Country", "Status"):
+        return name
+    raise ApiError(400, f"unknown metric '{name}'")
+
+
+# ===============================================================
+#                            ENDPOINTS
+# ===============================================================
+
+def ep_health(df, cols, params):
+    return {"status": "ok", "rows": len(df), "version": _STATE["version"]}
+
+
+def ep_countries(df, cols, params):
+    return sorted(df["Country"].unique())
+
+
+def ep_years(df, cols, params):
+    return sorted(int(y) for y in df["Year"].unique())
+
+
+def ep_columns(df, cols, params):
+    return {
+        "columns": _public_columns(df),
+        "kpis": {k: v for k, v in cols.items() if v},
+        "composite_indices": COMPOSITE_INDICES,
+    }
+
+
+def ep_rows(df, cols, params):
+    sel = _select(df, params)
+    public = _public_columns(df)
+    wanted = _list_param(params, "columns")
+    if wanted:
+        missing = [c for c in wanted if c not in public]
+        if missing:
+            raise ApiError(400, f"unknown column: {', '.join(missing)}")
+        keep = ["Country", "Year"] + [c for c in wanted if c not in ("Country", "Year")]
+    else:
+        keep = public
+    return json.loads(sel[keep].to_json(orient="records"))
+
+
+def ep_snapshot(df, cols, params):
+    country = params.get("country", [None])[-1]
+    if not country:
+        raise ApiError(400, "'country' is required")
+    year = _int_param(params, "year", int(df["Year"].max()))
+    snap = snapshot(df, cols, country, year)
+    if snap is None:
+        raise ApiError(404, f"no data for {country} in {year}")
+    return snap
+
+
+def ep_kpi(df, cols, params):
+    metric = params.get("metric", [None])[-1]
+    if not metric:
+        raise ApiError(400, "'metric' is required")
+    col = _resolve_metric(df, cols, metric)
+
+    sel = _select(df, params).sort_values(["Country", "Year"])
+    series = {}
+    for country, years, values in zip(
+        *_grouped(sel["Country"].to_numpy(), sel["Year"].to_numpy(), sel[col].to_numpy())
+    ):
+        series[country] = [{"year": int(y), "value": float(v)} for y, v in zip(years, values)]
+    return {"metric": col, "series": series}
+
+
+def _grouped(keys, *arrays):
+    """Split sorted parallel arrays at key boundaries."""
+    if len(keys) == 0:
+        return [], *([] for _ in arrays)
+    cuts = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate(([0], cuts))
+    return [keys[i] for i in starts], *(np.split(a, cuts) for a in arrays)
+
+
+ENDPOINTS = {
+    "/health": ep_health,
+    "/countries": ep_countries,
+    "/years": ep_years,
+    "/columns": ep_columns,
+    "/rows": ep_rows,
+    "/snapshot": ep_snapshot,
+    "/kpi": ep_kpi,
+}
+
+
+@lru_cache(maxsize=1024)
+def render(path, query):
+    """
+    Render one (path, canonical query) to (etag, body, gzipped body).
+    The data never changes after load, so responses are memoised.
+    """
+    handler = ENDPOINTS.get(path)
+    if handler is None:
+        raise ApiError(404, f"unknown endpoint '{path}'")
+
+    params = parse_qs(query, keep_blank_values=True)
+    payload = handler(_STATE["df"], _STATE["cols"], params)
+    body = json.dumps(payload, default=_json_default, separators=(",", ":")).encode()
+    gz = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+    return etag_for(path, query), body, gz
+
+
+def etag_for(path, query):
+    digest = hashlib.sha1(f"{_STATE['version']}|{path}|{query}".encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def canonical_query(query):
+    """
+    Order-insensitive query string so equivalent URLs share cache/ETag.
+    Sorted by key only (stable), so repeated params keep their order and
+    "last value wins" still picks the same one; values are re-encoded.
+    """
+    pairs = sorted(parse_qsl(query, keep_blank_values=True), key=lambda kv: kv[0])
+    return urlencode(pairs)
+
+
+# ===============================================================
+#                          HTTP HANDLER
+# ===============================================================
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "LifeExpectancyAPI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = canonical_query(url.query)
+
+        # Conditional request: an exact ETag match can only come from an
+        # earlier 200, so it is answered before rendering; "*" has to wait
+        # until the request is known to be valid
+        if path in ENDPOINTS and self._not_modified(etag_for(path, query), allow_any=False):
+            return
+
+        try:
+            etag, body, gz = render(path, query)
+        except ApiError as exc:
+            return self._send_error(exc.status, exc.message)
+
+        if self._not_modified(etag):
+            return
+
+        use_gzip = gz is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        payload = gz if use_gzip else body
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", f"public, max-age={CACHE_SECONDS}")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _not_modified(self, etag, allow_any=True):
+        client = self.headers.get("If-None-Match", "")
+        if not client:
+            return False
+        tags = {t.strip() for t in client.split(",")}
+        if etag not in tags and not (allow_any and "*" in tags):
+            return False
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", f"public, max-age={CACHE_SECONDS}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return True
+
+    def _send_error(self, status, message):
+        body = json.dumps({"error": message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# ===============================================================
+#                           ENTRY POINT
+# ===============================================================
+
+def make_server(host="127.0.0.1", port=8502, data=DATA_PATH):
+    load_state(data)
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Serve dashboard data as read-only JSON.")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8502)
+    p.add_argument("--data", default=DATA_PATH, help="dataset CSV path")
+    args = p.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.data)
+    print(f"Serving {len(_STATE['df'])} rows on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
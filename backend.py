@@ -0,0 +1,242 @@
+"""
+Shared data layer for the dashboard pages and the command-line tools
+(report renderer, JSON API, load test).
+
+Loading, cleaning, imputation, KPI column detection, composite indices
+and the country snapshot live here once, so the pages and every tool
+report the same numbers.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+DATA_PATH = "data/LifeExpectancyData.csv"
+
+
+# ===============================================================
+#                       LOADING & CLEANING
+# ===============================================================
+
+def impute_by_country(df, group="Country", time="Year"):
+    """
+    Fill numeric gaps per country in one grouped pass: linear interpolation
+    over `time`, carried forward/back at the edges, then the per-year
+    median, then the column median. Imputed cells are flagged in a
+    `_imputed` bitmask column (bit i = df.attrs["imputed_columns"][i]).
+    """
+    cols = [
+        c for c in df.select_dtypes(include=["number"]).columns
+        if c != time and not c.startswith("_")
+    ]
+    if len(cols) > 64:
+        raise ValueError("imputation bitmask supports at most 64 numeric columns")
+
+    df = df.copy()
+    miss_all = df[cols].isna().to_numpy()
+    gappy = np.flatnonzero(miss_all.any(axis=0))
+
+    if len(gappy):
+        # Sort by (country, year) once; `inv` restores the original row order
+        codes = pd.factorize(df[group])[0]
+        order = np.lexsort((df[time].to_numpy(), codes))
+        inv = np.empty_like(order)
+        inv[order] = np.arange(len(order))
+
+        # Column-major (columns x rows) so every pass below runs on contiguous rows
+        fill_cols = [cols[j] for j in gappy]
+        X = np.ascontiguousarray(df[fill_cols].to_numpy(dtype=float)[order].T)
+        t = df[time].to_numpy(dtype=float)[order]
+        miss = np.isnan(X)
+
+        # Row bounds of each row's country block in the sorted order
+        n = len(t)
+        rows = np.arange(n)
+        new_group = np.r_[True, codes[order][1:] != codes[order][:-1]]
+        first = np.maximum.accumulate(np.where(new_group, rows, 0))
+        last = np.minimum.accumulate(np.where(np.r_[new_group[1:], True], rows, n)[::-1])[::-1]
+
+        # Previous / next observed row per cell, kept only inside the same country
+        prev_i = np.maximum.accumulate(np.where(miss, -1, rows), axis=1)
+        next_i = np.minimum.accumulate(np.where(miss, n, rows)[:, ::-1], axis=1)[:, ::-1]
+        has_prev = prev_i >= first
+        has_next = next_i <= last
+        prev_i, next_i = prev_i.clip(0, n - 1), next_i.clip(0, n - 1)
+
+        prev_v = np.take_along_axis(X, prev_i, axis=1)
+        next_v = np.take_along_axis(X, next_i, axis=1)
+        prev_t, next_t = t[prev_i], t[next_i]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            interp = prev_v + (next_v - prev_v) * (t - prev_t) / (next_t - prev_t)
+        fill = np.where(
+            has_prev & has_next, interp,
+            np.where(has_prev, prev_v, np.where(has_next, next_v, np.nan)),
+        )
+
+        # Fallbacks for countries with no observation at all in a column
+        if np.isnan(fill[miss]).any():
+            year_median = pd.DataFrame(X.T).groupby(t).transform("median").to_numpy().T
+            col_median = pd.DataFrame(X.T).median().to_numpy()[:, None]
+            fill = np.where(np.isnan(fill), year_median, fill)
+            fill = np.where(np.isnan(fill), col_median, fill)
+
+        df[fill_cols] = np.where(miss, fill, X)[:, inv].T
+
+    k = len(cols)
+    mask_dtype = np.uint32 if k <= 32 else np.uint64
+    bits = np.left_shift(np.ones(k, dtype=mask_dtype), np.arange(k, dtype=mask_dtype))
+    df["_imputed"] = (miss_all * bits).sum(axis=1, dtype=mask_dtype)
+    df.attrs["imputed_columns"] = cols
+    return df
+
+
+def load_clean_data(path=DATA_PATH):
+    df = pd.read_csv(path)
+
+    df.columns = (
+        df.columns
+        .str.replace("\xa0", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+    df = df.loc[:, ~df.columns.duplicated() & ~df.columns.str.lower().str.startswith("thinness")].copy()
+
+    for col in df.columns:
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            pass
+
+    num_cols = df.select_dtypes(include=["number"]).columns
+    df[num_cols] = df[num_cols].replace([np.inf, -np.inf], np.nan)
+
+    return impute_by_country(df)
+
+
+def detect_col(df, keywords):
+    hits = []
+    for col in df.columns:
+        norm = col.lower().replace(" ", "").replace("_", "").replace("-", "")
+        if all(k in norm for k in keywords):
+            hits.append(col)
+    return sorted(hits, key=len)[0] if hits else None
+
+
+def min_max(series):
+    series = pd.to_numeric(series, errors="coerce")
+    mn, mx = series.min(), series.max()
+    if pd.isna(mn) or pd.isna(mx) or mn == mx:
+        return pd.Series(0.5, index=series.index)
+    return (series - mn) / (mx - mn)
+
+
+def detect_kpi_cols(df):
+    """Map short KPI keys to the dataset's actual column names."""
+    return {
+        "life":   detect_col(df, ["life", "expect"]),
+        "bmi":    detect_col(df, ["bmi"]),
+        "adult":  detect_col(df, ["adult", "mort"]),
+        "infant": detect_col(df, ["infant", "death"]),
+        "u5":     detect_col(df, ["under", "five"]),
+        "gdp":    detect_col(df, ["gdp"]),
+        "income": detect_col(df, ["income", "composition"]),
+        "sch":    detect_col(df, ["school"]),
+        "exp":    detect_col(df, ["percentage", "expenditure"]),
+    }
+
+
+# ===============================================================
+#                     COMPOSITE INDICES
+# ===============================================================
+
+COMPOSITE_INDICES = ["Health_Index", "Economic_Index", "Mortality_Pressure"]
+
+
+def add_composite_indices(df, cols):
+    df = df.copy()
+
+    df["Health_Index"] = (
+        min_max(df[cols["life"]]) +
+        min_max(df[cols["bmi"]]) +
+        (1 - min_max(df[cols["adult"]]))
+    ) / 3
+
+    df["Economic_Index"] = (
+        min_max(df[cols["gdp"]]) +
+        min_max(df[cols["income"]]) +
+        min_max(df[cols["sch"]])
+    ) / 3
+
+    df["Mortality_Pressure"] = (
+        min_max(df[cols["adult"]]) +
+        min_max(df[cols["infant"]]) +
+        min_max(df[cols["u5"]])
+    ) / 3
+
+    return df
+
+
+def load_dataset(path=DATA_PATH):
+    """Cleaned data with composite indices, plus the detected KPI columns."""
+    df = load_clean_data(path)
+    cols = detect_kpi_cols(df)
+    return add_composite_indices(df, cols), cols
+
+
+# ===============================================================
+#                     COUNTRY SNAPSHOT
+# ===============================================================
+
+# (key, card title, value format) — the six cards on the Overview page
+SNAPSHOT_KPIS = [
+    ("life",  "🌱 Life Expectancy (years)",      "{:.1f}"),
+    ("sch",   "📘 Schooling (years)",            "{:.1f}"),
+    ("gdp",   "💰 GDP per Capita (USD)",         "{:,.0f}"),
+    ("adult", "⚰️ Adult Mortality (per 1000)",   "{:.0f}"),
+    ("u5",    "🧸 Under-5 Mortality (per 1000)", "{:.0f}"),
+    ("exp",   "🏥 Gov Health Expenditure (%)",   "{:.1f}%"),
+]
+
+
+def snapshot(df, cols, country, year):
+    """
+    KPI values and interpretation for one country-year, or None if the
+    country has no row for that year.
+    """
+    rows = df[(df["Country"] == country) & (df["Year"] == year)]
+    if rows.empty:
+        return None
+    row = rows.iloc[0]
+
+    kpis = []
+    for key, title, fmt in SNAPSHOT_KPIS:
+        value = float(row[cols[key]])
+        if key == "gdp":
+            display = f"{int(value):,}"
+        else:
+            display = fmt.format(value)
+        kpis.append({"key": key, "title": title, "value": value, "display": display})
+
+    global_avg = round(df[cols["life"]].mean(), 1)
+    life_val = float(row[cols["life"]])
+
+    return {
+        "country": country,
+        "year": int(year),
+        "kpis": kpis,
+        "life_expectancy": life_val,
+        "global_avg": global_avg,
+        "above_average": life_val > global_avg,
+    }
+
+
+def interpretation_text(snap):
+    """The Overview page's high-level interpretation sentence (HTML)."""
+    msg_color = "🟢" if snap["above_average"] else "🟡"
+    return (
+        f"{msg_color} In {snap['year']}, <b>{snap['country']}</b> has a life expectancy of "
+        f"<b>{snap['life_expectancy']} years</b>, compared to the global average of "
+        f"<b>{snap['global_avg']} years</b>."
+    )
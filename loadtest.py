@@ -0,0 +1,426 @@
+"""
+Concurrent-session load test for the dashboard.
+
+Starts the dashboard (`streamlit run Overview.py`) as a local headless
+server and simulates N viewers against it. Each session is its own
+websocket connection — exactly what a browser tab opens — that replays a
+scripted interaction on Overview.py or a page in pages/. Every widget
+change is one rerun, timed from sending the new widget state until the
+server reports the script finished. Everything runs locally.
+
+For each session count it reports reruns/sec, p50/p95/p99 rerun latency,
+and the server process's CPU and RSS (total and per session). Each
+session count gets a fresh server, so its first (cold) reruns hit empty
+caches and all sessions start at once. Contention is reported as:
+
+    cold spread   slowest cold rerun / median cold rerun
+    cache wait    mean time a session's cold rerun took beyond the
+                  fastest cold rerun of the same page, i.e. time spent
+                  queueing behind the session that fills the shared
+                  st.cache_data entries (plus CPU sharing); nan
+                  when no page has more than one session
+    slowdown      warm p50 relative to the first session count; well
+                  above sessions/cores points at GIL or lock contention
+
+Needs Streamlit >= 1.54 (string-valued widget states for selectbox,
+radio, multiselect and select_slider) and its `websockets` client, a
+hard Streamlit dependency from 1.57 on; both are checked at startup.
+CPU and RSS are read from /proc and are only reported on Linux.
+
+Usage (from the project root):
+    python loadtest.py                          # 1, 2, 4, 8 sessions
+    python loadtest.py --sessions 1 4 16 --rounds 5
+    python loadtest.py --pages Overview.py pages/02_Data_Explorer.py
+"""
+
+import argparse
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+import streamlit
+from packaging.version import Version
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.Slider_pb2 import Slider as SliderProto
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+try:
+    from websockets.sync.client import connect
+except ImportError:
+    connect = None
+
+
+MAIN_SCRIPT = "Overview.py"
+MIN_STREAMLIT = "1.54"
+
+
+# ===============================================================
+#                     INTERACTION SCRIPTS
+# ===============================================================
+# Each script returns (label, action) steps for one session; every
+# action changes one widget and is followed by a timed rerun.
+
+def overview_script(s, rnd):
+    return [
+        ("select year", lambda: s.choose("selectbox", 0, rnd)),
+        ("select country", lambda: s.choose("selectbox", 1, rnd)),
+        ("select country", lambda: s.choose("selectbox", 1, rnd)),
+        ("select year", lambda: s.choose("selectbox", 0, rnd)),
+    ]
+
+
+def trends_script(s, rnd):
+    return [
+        ("select countries", lambda: s.choose_many("multiselect", 0, rnd, rnd.randint(2, 6))),
+        ("year range", lambda: s.choose_range("select_slider", 0, rnd)),
+        ("scatter year", lambda: s.choose("selectbox", 0, rnd)),
+        ("colour by cluster", lambda: s.choose("radio", 0, value="Cluster")),
+        ("change k", lambda: s.slide("slider", 0, rnd.randint(2, 8))),
+        ("colour by country", lambda: s.choose("radio", 0, value="Country")),
+    ]
+
+
+def explorer_script(s, rnd):
+    return [
+        ("filter country", lambda: s.choose("selectbox", 0, rnd)),
+        ("filter year", lambda: s.choose("selectbox", 1, rnd)),
+        ("clear country", lambda: s.choose("selectbox", 0, value="All")),
+        ("clear year", lambda: s.choose("selectbox", 1, value="All")),
+    ]
+
+
+def about_script(s, rnd):
+    return []
+
+
+SCRIPTS = {
+    "Overview.py": overview_script,
+    "pages/01_Trends_and_Comparison.py": trends_script,
+    "pages/02_Data_Explorer.py": explorer_script,
+    "pages/03_About.py": about_script,
+}
+
+
+def page_name(path):
+    """URL page name Streamlit derives from a script path ('' = main page)."""
+    if path == MAIN_SCRIPT:
+        return ""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return re.sub(r"^\d+_", "", stem)
+
+
+# ===============================================================
+#                       SERVER PROCESS
+# ===============================================================
+
+class Server:
+    def __init__(self, port):
+        self.port = port
+        self.proc = None
+
+    def __enter__(self):
+        self.proc = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", MAIN_SCRIPT,
+                "--server.headless", "true",
+                "--server.address", "127.0.0.1",
+                "--server.port", str(self.port),
+                "--server.enableXsrfProtection", "false",
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError("streamlit server exited during startup")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError("streamlit server did not become healthy within 60s")
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def cpu_seconds(self):
+        try:
+            with open(f"/proc/{self.proc.pid}/stat") as fh:
+                fields = fh.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError):
+            return float("nan")
+
+    def rss_bytes(self):
+        try:
+            with open(f"/proc/{self.proc.pid}/statm") as fh:
+                return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return float("nan")
+
+
+# ===============================================================
+#                           SESSIONS
+# ===============================================================
+
+class Session(threading.Thread):
+    def __init__(self, url, page, rounds, seed, barrier, timeout):
+        super().__init__(daemon=True)
+        self.url = url
+        self.page = page
+        self.rounds = rounds
+        self.rnd = random.Random(seed)
+        self.barrier = barrier
+        self.timeout = timeout
+        self.cold = None
+        self.latencies = []
+        self.errors = []
+        self.elements = []
+        self.widgets = {}
+
+    # --- widget helpers (operate on the last rerun's elements) ---
+
+    def _find(self, kind, index):
+        found = []
+        for ty, proto in self.elements:
+            if ty == "slider":
+                is_select = proto.type == SliderProto.SELECT_SLIDER
+                ty = "select_slider" if is_select else "slider"
+            if ty == kind:
+                found.append(proto)
+        return found[index]
+
+    def choose(self, kind, index, rnd=None, value=None):
+        proto = self._find(kind, index)
+        value = value if value is not None else rnd.choice(list(proto.options))
+        self.widgets[proto.id] = WidgetState(id=proto.id, string_value=value)
+
+    def choose_many(self, kind, index, rnd, k):
+        proto = self._find(kind, index)
+        ws = WidgetState(id=proto.id)
+        ws.string_array_value.data[:] = rnd.sample(list(proto.options), min(k, len(proto.options)))
+        self.widgets[proto.id] = ws
+
+    def choose_range(self, kind, index, rnd):
+        proto = self._find(kind, index)
+        lo, hi = sorted(rnd.sample(range(len(proto.options)), 2))
+        ws = WidgetState(id=proto.id)
+        ws.string_array_value.data[:] = [proto.options[lo], proto.options[hi]]
+        self.widgets[proto.id] = ws
+
+    def slide(self, kind, index, value):
+        proto = self._find(kind, index)
+        ws = WidgetState(id=proto.id)
+        ws.double_array_value.data[:] = [value]
+        self.widgets[proto.id] = ws
+
+    # --- protocol ---
+
+    def _rerun(self, ws):
+        msg = BackMsg()
+        msg.rerun_script.page_name = page_name(self.page)
+        msg.rerun_script.widget_states.widgets.extend(self.widgets.values())
+
+        start = time.perf_counter()
+        ws.send(msg.SerializeToString())
+        elements = []
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(ws.recv(timeout=self.timeout))
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                el = fwd.delta.new_element
+                ty = el.WhichOneof("type")
+                elements.append((ty, getattr(el, ty)))
+                if ty == "exception":
+                    self.errors.append(f"{self.page}: {el.exception.message}")
+            elif kind == "script_finished":
+                # An early finish means our rerun pre-empted one still running
+                if fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+        elapsed = time.perf_counter() - start
+
+        self.elements = elements
+        return elapsed
+
+    def run(self):
+        try:
+            with connect(self.url, subprotocols=["streamlit"], max_size=None) as ws:
+                self.barrier.wait()
+                self.cold = self._rerun(ws)
+                for _ in range(self.rounds):
+                    for _, action in SCRIPTS[self.page](self, self.rnd):
+                        action()
+                        self.latencies.append(self._rerun(ws))
+                    # A fresh page load, as when a viewer navigates back
+                    self.widgets.clear()
+                    self.latencies.append(self._rerun(ws))
+        except Exception as exc:
+            self.errors.append(f"{self.page}: {exc!r}")
+            self.barrier.abort()
+
+
+def run_level(n_sessions, pages, rounds, seed, timeout, port):
+    with Server(port) as server:
+        barrier = threading.Barrier(n_sessions + 1)
+        sessions = [
+            Session(server.url, pages[i % len(pages)], rounds, seed + i, barrier, timeout)
+            for i in range(n_sessions)
+        ]
+        for s in sessions:
+            s.start()
+
+        rss_before = server.rss_bytes()
+        cpu_before = server.cpu_seconds()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        start = time.perf_counter()
+        for s in sessions:
+            s.join()
+        wall = time.perf_counter() - start
+        cpu = server.cpu_seconds() - cpu_before
+        rss_after = server.rss_bytes()
+
+    warm = np.array([x for s in sessions for x in s.latencies])
+    cold = np.array([s.cold for s in sessions if s.cold is not None])
+
+    # Cold time beyond the fastest cold rerun of the same page; only pages
+    # opened by several sessions can contend on a cache entry
+    by_page = {}
+    for s in sessions:
+        if s.cold is not None:
+            by_page.setdefault(s.page, []).append(s.cold)
+    waits = np.array([t - min(ts) for ts in by_page.values() if len(ts) > 1 for t in ts])
+    reruns = len(warm) + len(cold)
+    pct = lambda a, q: float(np.percentile(a, q)) * 1000 if len(a) else float("nan")
+
+    return {
+        "sessions": n_sessions,
+        "reruns": reruns,
+        "rps": reruns / wall if wall else float("nan"),
+        "p50": pct(warm, 50),
+        "p95": pct(warm, 95),
+        "p99": pct(warm, 99),
+        "cold_p50": pct(cold, 50),
+        "cold_max": pct(cold, 100),
+        "cold_spread": pct(cold, 100) / pct(cold, 50) if len(cold) else float("nan"),
+        "cache_wait": float(waits.mean()) * 1000 if len(waits) else float("nan"),
+        "cpu_pct": 100 * cpu / wall if wall else float("nan"),
+        "cpu_per_session": cpu / n_sessions,
+        "rss_mb": rss_after / 2**20,
+        "rss_per_session_mb": max(rss_after - rss_before, 0) / 2**20 / n_sessions,
+        "errors": [e for s in sessions for e in s.errors],
+    }
+
+
+# ===============================================================
+#                           REPORTING
+# ===============================================================
+
+COLUMNS = [
+    ("sessions",           "sessions",   "{:>8d}"),
+    ("reruns",             "reruns",     "{:>7d}"),
+    ("rps",                "reruns/s",   "{:>9.1f}"),
+    ("p50",                "p50 ms",     "{:>8.0f}"),
+    ("p95",                "p95 ms",     "{:>8.0f}"),
+    ("p99",                "p99 ms",     "{:>8.0f}"),
+    ("cold_p50",           "cold p50",   "{:>9.0f}"),
+    ("cold_max",           "cold max",   "{:>9.0f}"),
+    ("cold_spread",        "cold spread", "{:>12.2f}"),
+    ("cache_wait",         "cache wait", "{:>11.0f}"),
+    ("slowdown",           "slowdown",   "{:>9.2f}"),
+    ("cpu_pct",            "CPU %",      "{:>7.0f}"),
+    ("cpu_per_session",    "CPU s/sess", "{:>11.2f}"),
+    ("rss_mb",             "RSS MB",     "{:>8.0f}"),
+    ("rss_per_session_mb", "ΔRSS/sess",  "{:>10.1f}"),
+]
+
+
+def print_header():
+    print(" ".join(f"{title:>{len(fmt.format(0))}}" for _, title, fmt in COLUMNS))
+
+
+def print_row(result):
+    print(" ".join(fmt.format(result[key]) for key, _, fmt in COLUMNS))
+
+
+# ===============================================================
+#                           ENTRY POINT
+# ===============================================================
+
+def check_environment():
+    """Return an error message if this Streamlit can't be driven, else None."""
+    if Version(streamlit.__version__) < Version(MIN_STREAMLIT):
+        return (
+            f"loadtest.py needs streamlit>={MIN_STREAMLIT} (string-valued widget "
+            f"states); found {streamlit.__version__}. Run: pip install 'streamlit>={MIN_STREAMLIT}'"
+        )
+    if connect is None:
+        return "loadtest.py needs the websockets package (>=12). Run: pip install websockets"
+    return None
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Load-test the dashboard with concurrent sessions.")
+    p.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8],
+                   help="session counts to test (default: 1 2 4 8)")
+    p.add_argument("--pages", nargs="+", default=list(SCRIPTS),
+                   help="scripts to replay; sessions are spread round-robin (default: all)")
+    p.add_argument("--rounds", type=int, default=3, help="script repetitions per session")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--timeout", type=float, default=60, help="per-rerun timeout in seconds")
+    p.add_argument("--port", type=int, default=8599, help="port for the test server")
+    args = p.parse_args(argv)
+
+    problem = check_environment()
+    if problem:
+        print(problem, file=sys.stderr)
+        return 2
+
+    unknown = [page for page in args.pages if page not in SCRIPTS]
+    if unknown:
+        print(f"No interaction script for: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    print(f"Pages: {', '.join(args.pages)}")
+    print(f"Rounds per session: {args.rounds}  |  CPU cores: {os.cpu_count()}\n")
+    print_header()
+
+    baseline = None
+    errors = []
+    for n in args.sessions:
+        result = run_level(n, args.pages, args.rounds, args.seed, args.timeout, args.port)
+        baseline = baseline or result["p50"]
+        result["slowdown"] = result["p50"] / baseline if baseline else float("nan")
+        print_row(result)
+        errors.extend(result["errors"])
+
+    if errors:
+        print(f"\n{len(errors)} rerun error(s), first: {errors[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
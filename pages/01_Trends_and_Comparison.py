@@ -1,64 +1,127 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 
+from backend import load_clean_data, detect_kpi_cols, add_composite_indices
+
 st.set_page_config(page_title="Trends & Comparisons", page_icon="📈", layout="wide")
 
 # -------------------------------------------------------
-# REUSE THE SAME LOGIC AS app.py (NO IMPORTS!)
+# DATA + COMPOSITE INDICES (SHARED WITH THE TOOLS VIA backend.py)
 # -------------------------------------------------------
 
-def detect_col(df, keys):
-    for col in df.columns:
-        norm = col.lower().replace(" ", "").replace("-", "")
-        if all(k in norm for k in keys):
-            return col
-    return None
-
-def min_max(series):
-    s = pd.to_numeric(series, errors="coerce")
-    mn, mx = s.min(), s.max()
-    if mn == mx:
-        return pd.Series(0.5, index=s.index)
-    return (s - mn) / (mx - mn)
-
 @st.cache_data
 def load_and_prepare():
-    df = pd.read_csv("data/LifeExpectancyData_CLEANED.csv")
-    df.columns = df.columns.str.replace("\xa0", " ", regex=True).str.strip()
-
-    # Detect columns
-    life   = detect_col(df, ["life","expect"])
-    bmi    = detect_col(df, ["bmi"])
-    adult  = detect_col(df, ["adult","mort"])
-    infant = detect_col(df, ["infant","death"])
-    under5 = detect_col(df, ["under","five"])
-    gdp    = detect_col(df, ["gdp"])
-    income = detect_col(df, ["income","composition"])
-    school = detect_col(df, ["school"])
-
-    # KPIs
-    df["Health_Index"] = (
-        min_max(df[life]) +
-        min_max(df[bmi]) +
-        (1 - min_max(df[adult]))
-    ) / 3
-
-    df["Economic_Index"] = (
-        min_max(df[gdp]) +
-        min_max(df[income]) +
-        min_max(df[school])
-    ) / 3
-
-    df["Mortality_Pressure"] = (
-        min_max(df[adult]) +
-        min_max(df[infant]) +
-        min_max(df[under5])
-    ) / 3
-
-    return df, life, gdp
-
-df, LIFE_COL, GDP_COL = load_and_prepare()
+    df = load_clean_data()
+    cols = detect_kpi_cols(df)
+    df = add_composite_indices(df, cols)
+
+    # Indicators used for clustering: (column, higher_is_better)
+    cluster_features = (
+        (cols["life"], True),
+        (cols["bmi"], True),
+        (cols["adult"], False),
+        (cols["u5"], False),
+        (cols["gdp"], True),
+        (cols["income"], True),
+        (cols["sch"], True),
+    )
+
+    return df, cols["life"], cols["gdp"], cluster_features
+
+df, LIFE_COL, GDP_COL, CLUSTER_FEATURES = load_and_prepare()
+
+# -------------------------------------------------------
+# COUNTRY CLUSTERING (VECTORISED K-MEANS)
+# -------------------------------------------------------
+
+def kmeans(X, k, n_init=8, seed=0, max_iter=100, tol=1e-8):
+    """
+    Best of `n_init` k-means++ seeded Lloyd runs. All restarts advance
+    together as one batch: distances are a single (n_init, n, k) array,
+    so each iteration is a few array ops rather than a Python loop per run.
+    Returns (labels, centroids) of the run with the lowest inertia.
+    """
+    rng = np.random.default_rng(seed)
+    n = X.shape[0]
+    runs = np.arange(n_init)
+    x_sq = np.einsum("ij,ij->i", X, X)
+
+    def sq_dist(C):
+        # C: (n_init, m, d) -> squared distances (n_init, n, m)
+        c_sq = np.einsum("rkd,rkd->rk", C, C)
+        cross = X @ C.transpose(0, 2, 1)
+        return np.maximum(x_sq[None, :, None] - 2 * cross + c_sq[:, None, :], 0)
+
+    # k-means++ seeding, one draw per restart per centroid (inverse CDF)
+    centroids = np.empty((n_init, k, X.shape[1]))
+    centroids[:, 0] = X[rng.integers(n, size=n_init)]
+    d2 = sq_dist(centroids[:, :1])[:, :, 0]
+    for j in range(1, k):
+        cdf = d2.cumsum(axis=1)
+        u = rng.random(n_init) * cdf[:, -1]
+        idx = np.minimum((cdf < u[:, None]).sum(axis=1), n - 1)
+        idx = np.where(cdf[:, -1] > 0, idx, rng.integers(n, size=n_init))
+        centroids[:, j] = X[idx]
+        d2 = np.minimum(d2, sq_dist(centroids[:, j:j + 1])[:, :, 0])
+
+    # Lloyd iterations; converged runs sit at a fixed point, so the whole
+    # batch keeps iterating until every run has settled
+    for _ in range(max_iter):
+        labels = sq_dist(centroids).argmin(axis=2)
+        onehot = (labels[:, :, None] == np.arange(k)).astype(float)
+        counts = onehot.sum(axis=1)
+        sums = onehot.transpose(0, 2, 1) @ X
+        new = np.where(counts[:, :, None] > 0, sums / np.maximum(counts, 1)[:, :, None], centroids)
+        shift = ((new - centroids) ** 2).sum(axis=(1, 2))
+        centroids = new
+        if (shift <= tol).all():
+            break
+
+    dist = sq_dist(centroids)
+    labels = dist.argmin(axis=2)
+    inertia = np.take_along_axis(dist, labels[:, :, None], axis=2)[:, :, 0].sum(axis=1)
+    best = inertia.argmin()
+    return labels[best], centroids[best]
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def cluster_countries(_df, features, k, year=None, n_init=8):
+    """
+    Cluster countries on the min-max normalised indicator matrix.
+
+    `year=None` clusters each country's average across all years.
+    Results are cached per (features, k, year, n_init); the dataframe
+    itself comes from the cached loader and is not hashed.
+    Cluster 1 is the most developed profile (highest mean centroid).
+    """
+    cols = [c for c, _ in features]
+    base = _df if year is None else _df[_df["Year"] == year]
+    M = base.groupby("Country")[cols].mean().dropna()
+
+    X = M.to_numpy(dtype=float)
+    mn, mx = X.min(axis=0), X.max(axis=0)
+    span = np.where(mx > mn, mx - mn, 1.0)
+    X = np.where(mx > mn, (X - mn) / span, 0.5)
+    invert = np.array([not better for _, better in features])
+    X[:, invert] = 1 - X[:, invert]
+
+    k = min(k, len(X))
+    labels, centroids = kmeans(X, k, n_init=n_init)
+
+    # Stable, meaningful ids: order clusters by overall development score
+    order = np.argsort(-centroids.mean(axis=1))
+    rank = np.empty(k, dtype=int)
+    rank[order] = np.arange(k)
+
+    names = [f"Cluster {i + 1}" for i in range(k)]
+    assignments = pd.DataFrame({
+        "Country": M.index,
+        "Cluster": [names[r] for r in rank[labels]],
+    })
+    centroid_df = pd.DataFrame(centroids[order], columns=cols, index=names)
+    return assignments, centroid_df
 
 # -------------------------------------------------------
 # UI — CLEAN MINIMAL ACADEMIC DARK THEME
@@ -151,27 +214,61 @@ with tab3:
 # -------------------------------------------------------
 st.subheader("Health vs Economic Strength")
 
-year_for_plot = st.selectbox(
-    "Select Year for Scatter",
-    years,
-    index=len(years)-1
-)
+sc1, sc2, sc3, sc4 = st.columns([1.2, 1, 1, 1])
+
+with sc1:
+    year_for_plot = st.selectbox(
+        "Select Year for Scatter",
+        years,
+        index=len(years)-1
+    )
+
+with sc2:
+    color_by = st.radio("Colour by", ["Country", "Cluster"], horizontal=True)
+
+with sc3:
+    n_clusters = st.slider("Clusters (k)", 2, 8, 4, disabled=color_by != "Cluster")
+
+with sc4:
+    cluster_scope = st.radio(
+        "Cluster on",
+        ["Scatter year", "All years"],
+        horizontal=True,
+        disabled=color_by != "Cluster",
+    )
 
 df_scatter = df[(df["Year"] == year_for_plot) & (df["Country"].isin(selected_countries))]
 
+category_orders = {}
+if color_by == "Cluster":
+    assignments, centroids = cluster_countries(
+        df,
+        CLUSTER_FEATURES,
+        n_clusters,
+        year=year_for_plot if cluster_scope == "Scatter year" else None,
+    )
+    df_scatter = df_scatter.merge(assignments, on="Country", how="left")
+    category_orders = {"Cluster": list(centroids.index)}
+
 fig_scatter = px.scatter(
     df_scatter,
     x="Economic_Index",
     y="Health_Index",
-    color="Country",
+    color=color_by,
     size=GDP_COL,
     size_max=25,
+    hover_name="Country",
+    category_orders=category_orders,
     template="plotly_dark",
     title=f"Health vs Economic Index — {year_for_plot}",
 )
 
 st.plotly_chart(fig_scatter, use_container_width=True)
 
+if color_by == "Cluster":
+    with st.expander("Cluster profiles (normalised centroids, mortality inverted)"):
+        st.dataframe(centroids.round(2), use_container_width=True)
+
 st.markdown("""
 **Interpretation:**  
 - Countries in the **top-right** quadrant are both *wealthy and healthy*.  
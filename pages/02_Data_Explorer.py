@@ -1,31 +1,106 @@
+import warnings
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 
+from backend import load_clean_data
+
 # ===============================================================
-#     LOCAL BACKEND (MATCHES SAME BACKEND AS TRENDS PAGE)
+#            COLUMN PROFILING (ONE VECTORISED PASS)
 # ===============================================================
 
-def load_clean_data():
-    df = pd.read_csv("data/LifeExpectancyData_CLEANED.csv")
-
-    df.columns = (
-        df.columns
-        .str.replace("\xa0", " ", regex=True)
-        .str.replace(r"\s+", " ", regex=True)
-        .str.strip()
-    )
-
-    df = df.loc[:, ~df.columns.duplicated()].copy()
-
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="ignore")
-
-    for col in df.select_dtypes(include=["number"]).columns:
-        df[col].replace([np.inf, -np.inf], np.nan, inplace=True)
-
-    df.fillna(df.median(numeric_only=True), inplace=True)
-    return df
+HIST_BINS = 20
+
+
+def apply_filters(df, country, year):
+    filtered = df
+
+    if country != "All":
+        filtered = filtered[filtered["Country"] == country]
+
+    if year != "All":
+        filtered = filtered[filtered["Year"] == year]
+
+    return filtered
+
+
+def profile_columns(df, edges=None):
+    """
+    Statistics and histogram counts for every numeric column, computed
+    together on one float matrix. Pass the unfiltered base's `edges` so
+    histogram bins stay comparable across filters.
+    Returns (stats, hist, edges).
+    """
+    cols = [c for c in df.select_dtypes(include=["number"]).columns if not c.startswith("_")]
+    X = df[cols].to_numpy(dtype=float)
+    valid = ~np.isnan(X)
+    k = len(cols)
+
+    with warnings.catch_warnings():
+        # all-NaN columns (e.g. an empty filter) just profile as NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if len(X):
+            q = np.nanpercentile(X, [0, 25, 50, 75, 100], axis=0)
+            mean = np.nanmean(X, axis=0)
+            std = np.nanstd(X, axis=0, ddof=1)
+        else:
+            q = np.full((5, k), np.nan)
+            mean = std = np.full(k, np.nan)
+
+    # Source gaps per column: the loader imputes them before profiling, so
+    # they are decoded from its bitmask (plus anything still NaN)
+    missing = (~valid).sum(axis=0)
+    flagged = df.attrs.get("imputed_columns", [])
+    if "_imputed" in df.columns and flagged:
+        bits = df["_imputed"].to_numpy(dtype=np.uint64)
+        per_bit = ((bits[:, None] >> np.arange(len(flagged), dtype=np.uint64)) & 1).sum(axis=0)
+        pos = {c: i for i, c in enumerate(cols)}
+        for col, count in zip(flagged, per_bit):
+            if col in pos:
+                missing[pos[col]] += count
+
+    stats = pd.DataFrame({
+        "Count":   len(X) - missing,
+        "Missing": missing,
+        "Mean":    mean,
+        "Std":     std,
+        "Min":     q[0],
+        "25%":     q[1],
+        "Median":  q[2],
+        "75%":     q[3],
+        "Max":     q[4],
+    }, index=cols)
+
+    # Histograms for all columns at once: offset each column's bin ids and
+    # count them with a single bincount
+    if edges is None:
+        lo = np.nan_to_num(q[0])
+        hi = np.nan_to_num(q[4])
+        edges = np.linspace(lo, hi, HIST_BINS + 1, axis=1)
+    lo = edges[:, :1]
+    width = (edges[:, -1:] - lo) / HIST_BINS
+    width[width == 0] = 1
+
+    with np.errstate(invalid="ignore"):
+        idx = np.clip(np.floor((X - lo.T) / width.T), 0, HIST_BINS - 1)
+    flat = (idx + np.arange(k) * HIST_BINS)[valid].astype(np.int64)
+    hist = np.bincount(flat, minlength=k * HIST_BINS).reshape(k, HIST_BINS)
+
+    return stats, hist, edges
+
+
+@st.cache_data(show_spinner=False)
+def load_explorer_data():
+    """Cleaned data plus the unfiltered profile, computed once at load."""
+    df = load_clean_data()
+    return df, profile_columns(df)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def filtered_profile(_df, _edges, country, year):
+    """Profile of one filter, cached by the (country, year) filter key."""
+    return profile_columns(apply_filters(_df, country, year), edges=_edges)
 
 
 # ===============================================================
@@ -35,7 +110,7 @@ def load_clean_data():
 st.set_page_config(page_title="Data Explorer", page_icon="📊", layout="wide")
 st.title("📊 Data Explorer")
 
-df = load_clean_data()
+df, base_profile = load_explorer_data()
 
 countries = ["All"] + sorted(df["Country"].unique())
 years     = ["All"] + sorted(df["Year"].unique().tolist())
@@ -46,20 +121,47 @@ with c1:
 with c2:
     selected_year = st.selectbox("Year", years)
 
-filtered = df.copy()
-
-if selected_country != "All":
-    filtered = filtered[filtered["Country"] == selected_country]
+filtered = apply_filters(df, selected_country, selected_year)
 
-if selected_year != "All":
-    filtered = filtered[filtered["Year"] == selected_year]
+# Internal columns (e.g. the `_imputed` bitmask) stay out of the table and export
+visible = filtered.loc[:, ~filtered.columns.str.startswith("_")]
 
-st.dataframe(filtered, use_container_width=True, height=450)
+st.dataframe(visible, use_container_width=True, height=450)
 
 # Download option
 st.download_button(
     "Download Filtered CSV",
-    filtered.to_csv(index=False).encode(),
+    visible.to_csv(index=False).encode(),
     "filtered_data.csv",
     "text/csv"
 )
+
+# ===============================================================
+#                     COLUMN PROFILE PANEL
+# ===============================================================
+
+st.subheader("📐 Column Profile")
+
+if selected_country == "All" and selected_year == "All":
+    stats, hist, edges = base_profile
+else:
+    stats, hist, edges = filtered_profile(df, base_profile[2], selected_country, selected_year)
+
+st.caption(
+    f"{len(filtered):,} rows · {filtered['Country'].nunique()} countries · "
+    "Missing = gaps in the source data, filled by the loader (per-country "
+    "interpolation) before the statistics below"
+)
+
+st.dataframe(stats.round(2), use_container_width=True)
+
+hist_col = st.selectbox("Histogram", list(stats.index))
+j = stats.index.get_loc(hist_col)
+centers = (edges[j, :-1] + edges[j, 1:]) / 2
+
+# Built-in chart: a 20-bar histogram doesn't need a Plotly figure per rerun
+st.bar_chart(
+    pd.DataFrame({hist_col: centers, "Rows": hist[j]}),
+    x=hist_col,
+    y="Rows",
+)
@@ -133,7 +133,8 @@ The dashboard consists of multiple interactive pages, designed for clarity and e
 
 <ul>
 <li><b>Landing Page</b> — A country snapshot with KPIs, trends, and a global interpretation.</li>
-<li><b>Trends & Comparison</b> — Year-wise visual trends, GDP correlations, and top/bottom country rankings.</li>
+<li><b>Trends & Comparison</b> — Year-wise visual trends, GDP correlations, top/bottom country rankings, and 
+K-means clustering of countries by health, mortality, and economic indicators.</li>
 <li><b>Data Explorer</b> — Offers full table exploration, filtering, and CSV export.</li>
 <li><b>About</b> — Methodology, dataset description, and project rationale.</li>
 </ul>
@@ -220,9 +221,6 @@ can further expand its analytical capabilities:
 <li><b>Time-Series Forecasting</b> — Implement predictive models (ARIMA, Prophet, LSTM) to estimate future 
 life expectancy trends for each country.</li>
 
-<li><b>Clustering & Segmentation</b> — Use machine learning methods such as K-means or hierarchical clustering 
-to group countries based on health, mortality, and economic indicators.</li>
-
 <li><b>Regional Deep-Dive</b> — Add continent- or region-level comparative dashboards to analyze disparities and 
 spot geographic health patterns.</li>
 
@@ -0,0 +1,244 @@
+"""
+Headless batch renderer for offline country reports.
+
+Renders one HTML report per country with the Overview snapshot (six KPI
+cards + interpretation) and the Trends charts (life expectancy and
+composite indices). Reports are rendered in a process pool; the dataset
+is loaded once and shared read-only with the workers.
+
+Reports work fully offline: plotly.js is written once per output
+directory (plotly.min.js) and referenced locally, with no CDN or web
+fonts. Keep it next to the reports when copying them elsewhere.
+
+Usage:
+    python render_reports.py                          # every country, at its latest year
+    python render_reports.py --countries Germany India --year 2010
+    python render_reports.py --out reports/ --workers 8
+
+Open a report in a browser and print to PDF for a paper copy.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import plotly.express as px
+from plotly.offline import get_plotlyjs
+
+from backend import DATA_PATH, COMPOSITE_INDICES, load_dataset, snapshot, interpretation_text
+
+
+# ===============================================================
+#                        HTML TEMPLATE
+# ===============================================================
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotlyjs}"></script>
+<style>
+body {{ font-family: 'Inter', -apple-system, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; background: #111827; color: #F3F4F6; margin: 0 auto; max-width: 1100px; padding: 24px; }}
+h1, h2 {{ font-weight: 700; }}
+.centered {{ text-align: center; }}
+.kpi-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 14px; }}
+.kpi-card {{ background: rgba(255,255,255,0.05); border: 1px solid rgba(255,255,255,0.08); padding: 22px; border-radius: 16px; }}
+.kpi-title {{ font-size: 0.9rem; opacity: 0.85; margin-bottom: 4px; }}
+.kpi-value {{ font-size: 1.7rem; font-weight: 700; }}
+.interpretation {{ background: rgba(255,255,255,0.06); padding: 18px; border-radius: 12px; }}
+@media print {{ body {{ background: #fff; color: #000; }} .chart {{ page-break-inside: avoid; }} }}
+</style>
+</head>
+<body>
+<div class="centered">
+    <h1>Life Expectancy Dashboard</h1>
+    <p style="opacity: 0.85;">Country report — generated {generated}</p>
+</div>
+<h2>Country Snapshot — {country} ({year})</h2>
+<div class="kpi-grid">
+{cards}
+</div>
+<h2>High-level Interpretation</h2>
+<div class="interpretation">{interpretation}</div>
+<h2>Life Expectancy Trends</h2>
+<div class="chart">{life_chart}</div>
+<h2>Composite Index Trends</h2>
+<div class="chart">{composite_chart}</div>
+</body>
+</html>
+"""
+
+CARD = """    <div class="kpi-card">
+        <div class="kpi-title">{title}</div>
+        <div class="kpi-value">{display}</div>
+    </div>"""
+
+
+# ===============================================================
+#                 WORKER STATE (READ-ONLY, PER PROCESS)
+# ===============================================================
+
+_DATA = None
+
+
+def _init_worker(path):
+    # With the fork start method the parent's dataset is inherited as-is;
+    # otherwise each worker loads it exactly once.
+    global _DATA
+    if _DATA is None:
+        _DATA = load_dataset(path)
+
+
+def slugify(name):
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_") or "country"
+
+
+PLOTLYJS = "plotly.min.js"
+
+
+def write_plotlyjs(out_dir):
+    """Bundle plotly.js once per output directory; reports load it relatively."""
+    path = os.path.join(out_dir, PLOTLYJS)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(get_plotlyjs())
+    return path
+
+
+def render_country(country, year, out_dir):
+    """Render one report. Returns (country, path, seconds)."""
+    start = time.perf_counter()
+    df, cols = _DATA
+
+    snap = snapshot(df, cols, country, year)
+    if snap is None:
+        raise ValueError(f"no data for {country} in {year}")
+
+    df_c = df[df["Country"] == country].sort_values("Year")
+
+    fig_life = px.line(
+        df_c,
+        x="Year",
+        y=cols["life"],
+        markers=True,
+        template="plotly_dark",
+        title="Life Expectancy Over Time",
+    )
+    fig_comp = px.line(
+        df_c,
+        x="Year",
+        y=COMPOSITE_INDICES,
+        template="plotly_dark",
+        title="Health Index, Economic Index and Mortality Pressure",
+    )
+
+    html = PAGE.format(
+        title=f"{country} ({year}) — Life Expectancy Report",
+        plotlyjs=PLOTLYJS,
+        generated=time.strftime("%Y-%m-%d %H:%M"),
+        country=country,
+        year=year,
+        cards="\n".join(CARD.format(**k) for k in snap["kpis"]),
+        interpretation=interpretation_text(snap),
+        life_chart=fig_life.to_html(full_html=False, include_plotlyjs=False),
+        composite_chart=fig_comp.to_html(full_html=False, include_plotlyjs=False),
+    )
+
+    path = os.path.join(out_dir, f"{slugify(country)}_{year}.html")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(html)
+
+    return country, path, time.perf_counter() - start
+
+
+# ===============================================================
+#                           ENTRY POINT
+# ===============================================================
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Render offline country reports.")
+    p.add_argument("--countries", nargs="+", help="countries to render (default: all)")
+    p.add_argument("--year", type=int, help="snapshot year (default: each country's latest)")
+    p.add_argument("--out", default="reports", help="output directory (default: reports/)")
+    p.add_argument("--workers", type=positive_int, default=os.cpu_count() or 1,
+                   help="worker processes (default: CPU count)")
+    p.add_argument("--data", default=DATA_PATH, help="dataset CSV path")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    global _DATA
+    args = parse_args(argv)
+
+    _DATA = load_dataset(args.data)
+    df, _ = _DATA
+
+    countries = args.countries or sorted(df["Country"].unique())
+    unknown = sorted(set(countries) - set(df["Country"]))
+    if unknown:
+        print(f"Unknown countries: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    if args.year is None:
+        # Not every country reports the final year: use each one's latest
+        latest = df.groupby("Country")["Year"].max()
+        jobs = [(c, int(latest[c])) for c in countries]
+        label = "each country's latest year"
+    else:
+        jobs = [(c, args.year) for c in countries]
+        label = str(args.year)
+        if not args.countries:
+            present = set(df.loc[df["Year"] == args.year, "Country"])
+            skipped = [c for c in countries if c not in present]
+            jobs = [(c, y) for c, y in jobs if c in present]
+            if skipped:
+                print(f"Skipping {len(skipped)} countries with no data for {args.year}: "
+                      f"{', '.join(skipped)}")
+
+    os.makedirs(args.out, exist_ok=True)
+    write_plotlyjs(args.out)
+    total = len(jobs)
+    failures = 0
+    busy = 0.0
+    start = time.perf_counter()
+
+    print(f"Rendering {total} report(s) for {label} with {args.workers} worker(s) → {args.out}/")
+
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=_init_worker,
+        initargs=(args.data,),
+    ) as pool:
+        futures = {pool.submit(render_country, c, y, args.out): c for c, y in jobs}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            country = futures[fut]
+            try:
+                _, path, secs = fut.result()
+            except Exception as exc:
+                failures += 1
+                print(f"[{done:>{len(str(total))}}/{total}] {country:<32} FAILED: {exc}")
+                continue
+            busy += secs
+            print(f"[{done:>{len(str(total))}}/{total}] {country:<32} {secs:6.2f}s  {path}")
+
+    wall = time.perf_counter() - start
+    ok = total - failures
+    print(
+        f"Done: {ok}/{total} report(s) in {wall:.2f}s wall "
+        f"({busy:.2f}s render time, {busy / max(ok, 1):.2f}s avg)"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())